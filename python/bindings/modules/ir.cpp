@@ -1913,15 +1913,13 @@ void BindIR(nb::module_& m) {
                       const std::vector<std::pair<std::string, std::any>>& kwargs,
                       const Span& span) -> ConversionResult {
               nb::gil_scoped_acquire guard;
-              // Convert kwargs to Python list of (key, value) tuples
-              nb::list py_kwargs_list;
+              // Convert kwargs to a Python dict so converters get O(1) lookups by name
+              nb::dict py_kwargs;
               for (const auto& [key, val] : kwargs) {
-                nb::object py_val = AnyToPyObject<DataType, MemorySpace, TensorLayout, PadValue, bool, int,
-                                                  std::string, double>(val, key);
-                nb::tuple pair = nb::make_tuple(nb::cast(key), py_val);
-                py_kwargs_list.append(pair);
+                py_kwargs[key.c_str()] = AnyToPyObject<DataType, MemorySpace, TensorLayout, PadValue, bool,
+                                                       int, std::string, double>(val, key);
               }
-              nb::object result = py_func(nb::cast(args), py_kwargs_list, nb::cast(span));
+              nb::object result = py_func(nb::cast(args), py_kwargs, nb::cast(span));
               // Result can be:
               // 1. An ExprPtr (simple conversion)
               // 2. A tuple of (list[StmtPtr], ExprPtr) (complex conversion)
@@ -1936,7 +1934,8 @@ void BindIR(nb::module_& m) {
       },
       nb::arg("from_op"), nb::arg("func"),
       "Register a custom conversion function for a tensor op.\n\n"
-      "The function receives (args, kwargs, span) and should return either:\n"
+      "The function receives (args, kwargs, span), where kwargs is a dict[str, Any],\n"
+      "and should return either:\n"
       "- An Expr (simple conversion)\n"
       "- A tuple (list[Stmt], Expr) for complex conversions with prologue statements");
 
@@ -68,6 +68,9 @@ from .type import (  # also shadows C++ TensorView/TileView with Python subclass
     TileView,
 )
 
+# Import span-capture toggle for IR builders
+from .utils import set_span_capture
+
 # Export common DataType values for convenience
 FP4 = DataType.FP4
 FP8E4M3FN = DataType.FP8E4M3FN
@@ -115,6 +118,7 @@ __all__ = [
     "op_conversion",
     "register_op_conversion",
     "make_roundtrip_instrument",
+    "set_span_capture",
     "directions",
     "make_call",
     "input",
@@ -39,6 +39,7 @@ from .instruments import make_roundtrip_instrument
 from .op_conversion import ConversionContext, op_conversion, register_op_conversion
 from .pass_manager import OptimizationStrategy, PassManager
 from .printer import python_print
+from .utils import set_span_capture
 
 # Per-call-site direction aliases re-exported at the top level.
 input: ArgDirection
@@ -90,6 +91,7 @@ __all__ = [
     "op_conversion",
     "register_op_conversion",
     "make_roundtrip_instrument",
+    "set_span_capture",
     "directions",
     "make_call",
     "input",
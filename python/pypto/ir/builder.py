@@ -23,7 +23,8 @@ from typing import Any
 from pypto.pypto_core import DataType, ir
 from pypto.pypto_core.ir import IRBuilder as CppIRBuilder
 
-from .utils import _normalize_expr
+from . import utils as _utils
+from .utils import _UNKNOWN_SPAN, _normalize_expr
 
 
 class IRBuilder:
@@ -833,6 +834,9 @@ class IRBuilder:
         Returns:
             Span: Source location of the caller
         """
+        if not _utils._SPAN_CAPTURE_ENABLED:
+            return _UNKNOWN_SPAN
+
         # Go back 2 frames:
         # frame 0 = _capture_call_span
         # frame 1 = our wrapper method (var, assign, etc.)
@@ -841,8 +845,7 @@ class IRBuilder:
         if frame is not None and frame.f_back is not None:
             frame = frame.f_back.f_back
         if frame is not None:
-            info = inspect.getframeinfo(frame)
-            return ir.Span(info.filename, info.lineno, -1)
+            return ir.Span(frame.f_code.co_filename, frame.f_lineno, -1)
         return ir.Span.unknown()
 
     def _combine_spans(self, begin: ir.Span, end: ir.Span) -> ir.Span:
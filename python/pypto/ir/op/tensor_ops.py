@@ -10,7 +10,8 @@
 """Tensor operations for PyPTO IR."""
 
 import math
-from collections.abc import Sequence
+import types
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 from pypto.pypto_core import DataType
@@ -31,6 +32,27 @@ from ..utils import _get_span_or_capture, _normalize_expr, _to_make_tuple, resol
 from ._pad_value import normalize_pad_value
 from .tile_ops import resolve_gather_compare_cmp_mode
 
+# Bound once at import so every builder below skips the ``_ir_core`` module
+# attribute lookup when constructing its Call node.
+_create_op_call = _ir_core.create_op_call
+
+# Kwargs for the all-default matmul form. Read-only; ``create_op_call`` takes a
+# real dict, so each call passes its own copy.
+_MATMUL_DEFAULT_KWARGS: Mapping[str, Any] = types.MappingProxyType(
+    {"a_trans": False, "b_trans": False, "c_matrix_nz": False}
+)
+
+
+def _binary_op_name(base: str, rhs: int | float | Expr) -> str:
+    """Return ``tensor.<base>s`` for a scalar rhs and ``tensor.<base>`` otherwise.
+
+    Python literals always normalize to a scalar constant, so they select the
+    scalar variant without building the constant and probing its type.
+    """
+    if not isinstance(rhs, Expr) or isinstance(rhs.type, ScalarType):
+        return f"tensor.{base}s"
+    return f"tensor.{base}"
+
 
 def create(
     shape: Sequence[int | Expr] | _ir_core.MakeTuple,
@@ -102,7 +124,7 @@ def create(
             raise ValueError(f"create_tensor: init_value must be finite, got {init_value}.")
         kwargs["init_value"] = float(init_value)
 
-    return _ir_core.create_op_call("tensor.create", args, kwargs, actual_span)
+    return _create_op_call("tensor.create", args, kwargs, actual_span)
 
 
 create_tensor = create
@@ -132,7 +154,7 @@ def full(
     else:
         value_expr = ConstFloat(value, dtype, actual_span)
     kwargs: dict[str, Any] = {"dtype": dtype}
-    return _ir_core.create_op_call("tensor.full", [shape_tuple, value_expr], kwargs, actual_span)
+    return _create_op_call("tensor.full", [shape_tuple, value_expr], kwargs, actual_span)
 
 
 def ci(
@@ -168,7 +190,7 @@ def ci(
         start_expr = ConstInt(start, dtype, actual_span)
     shape_tuple = _to_make_tuple(shape, actual_span)
     kwargs: dict[str, Any] = {"dtype": dtype, "descending": descending}
-    return _ir_core.create_op_call("tensor.ci", [start_expr, shape_tuple], kwargs, actual_span)
+    return _create_op_call("tensor.ci", [start_expr, shape_tuple], kwargs, actual_span)
 
 
 arange = ci
@@ -197,7 +219,7 @@ def read(
     indices_tuple = _to_make_tuple(indices, actual_span)
 
     args = [tensor, indices_tuple]
-    return _ir_core.create_op_call("tensor.read", args, {}, actual_span)
+    return _create_op_call("tensor.read", args, {}, actual_span)
 
 
 def write(
@@ -227,7 +249,7 @@ def write(
     indices_tuple = _to_make_tuple(indices, actual_span)
 
     args = [tensor, indices_tuple, value]
-    return _ir_core.create_op_call("tensor.write", args, {}, actual_span)
+    return _create_op_call("tensor.write", args, {}, actual_span)
 
 
 def dim(tensor: Expr, axis: int | Expr, span: Span | None = None) -> Call:
@@ -244,7 +266,7 @@ def dim(tensor: Expr, axis: int | Expr, span: Span | None = None) -> Call:
     actual_span = _get_span_or_capture(span)
     axis_expr = _normalize_expr(axis, actual_span, int_dtype=DataType.INDEX)
     args = [tensor, axis_expr]
-    return _ir_core.create_op_call("tensor.dim", args, {}, actual_span)
+    return _create_op_call("tensor.dim", args, {}, actual_span)
 
 
 def slice(
@@ -293,7 +315,7 @@ def slice(
         # `drop_dims` may be ints (direct API) or ConstInt exprs (text parser);
         # _to_make_tuple normalizes either form. Non-ConstInt exprs are rejected
         # by the deducer with a clear message.
-        args.append(_to_make_tuple(list(drop_dims), actual_span))
+        args.append(_to_make_tuple(drop_dims, actual_span))
     elif valid_shape is not None:
         args.append(_to_make_tuple(valid_shape, actual_span))
 
@@ -305,7 +327,7 @@ def slice(
         # validation match tensor.fillpad exactly.
         kwargs["pad_value"] = pad_value if pad_value is PadValue.null else normalize_pad_value(pad_value)
 
-    return _ir_core.create_op_call("tensor.slice", args, kwargs, actual_span)
+    return _create_op_call("tensor.slice", args, kwargs, actual_span)
 
 
 def fillpad(
@@ -324,7 +346,7 @@ def fillpad(
         Call expression creating a padded tensor
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call(
+    return _create_op_call(
         "tensor.fillpad", [tensor], {"pad_value": normalize_pad_value(pad_value)}, actual_span
     )
 
@@ -355,6 +377,9 @@ def matmul(
     actual_span = _get_span_or_capture(span)
     args = [lhs, rhs]
 
+    if out_dtype is None and a_trans is False and b_trans is False and c_matrix_nz is False:
+        return _create_op_call("tensor.matmul", args, dict(_MATMUL_DEFAULT_KWARGS), actual_span)
+
     kwargs: dict[str, Any] = {
         "a_trans": a_trans,
         "b_trans": b_trans,
@@ -363,7 +388,7 @@ def matmul(
     if out_dtype is not None:
         kwargs["out_dtype"] = out_dtype
 
-    return _ir_core.create_op_call("tensor.matmul", args, kwargs, actual_span)
+    return _create_op_call("tensor.matmul", args, kwargs, actual_span)
 
 
 def matmul_acc(
@@ -389,7 +414,7 @@ def matmul_acc(
     """
     actual_span = _get_span_or_capture(span)
     kwargs: dict[str, Any] = {"a_trans": a_trans, "b_trans": b_trans}
-    return _ir_core.create_op_call("tensor.matmul_acc", [acc, lhs, rhs], kwargs, actual_span)
+    return _create_op_call("tensor.matmul_acc", [acc, lhs, rhs], kwargs, actual_span)
 
 
 def mul(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
@@ -407,17 +432,10 @@ def mul(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
         Call expression for element-wise multiplication
     """
     actual_span = _get_span_or_capture(span)
-    rhs_expr = (
-        _normalize_expr(rhs, actual_span, int_dtype=DataType.FP32, float_dtype=DataType.FP32)
-        if not isinstance(rhs, Expr)
-        else rhs
-    )
-
-    rhs_type = rhs_expr.type
-    if isinstance(rhs_type, ScalarType):
-        return _ir_core.create_op_call("tensor.muls", [lhs, rhs_expr], {}, actual_span)
-    else:
-        return _ir_core.create_op_call("tensor.mul", [lhs, rhs_expr], {}, actual_span)
+    op_name = _binary_op_name("mul", rhs)
+    if not isinstance(rhs, Expr):
+        rhs = _normalize_expr(rhs, actual_span, int_dtype=DataType.FP32, float_dtype=DataType.FP32)
+    return _create_op_call(op_name, [lhs, rhs], {}, actual_span)
 
 
 def muls(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
@@ -437,7 +455,7 @@ def muls(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
         if not isinstance(rhs, Expr)
         else rhs
     )
-    return _ir_core.create_op_call("tensor.muls", [lhs, rhs_expr], {}, actual_span)
+    return _create_op_call("tensor.muls", [lhs, rhs_expr], {}, actual_span)
 
 
 def add(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
@@ -455,17 +473,10 @@ def add(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
         Call expression for element-wise addition
     """
     actual_span = _get_span_or_capture(span)
-    rhs_expr = (
-        _normalize_expr(rhs, actual_span, int_dtype=DataType.FP32, float_dtype=DataType.FP32)
-        if not isinstance(rhs, Expr)
-        else rhs
-    )
-
-    rhs_type = rhs_expr.type
-    if isinstance(rhs_type, ScalarType):
-        return _ir_core.create_op_call("tensor.adds", [lhs, rhs_expr], {}, actual_span)
-    else:
-        return _ir_core.create_op_call("tensor.add", [lhs, rhs_expr], {}, actual_span)
+    op_name = _binary_op_name("add", rhs)
+    if not isinstance(rhs, Expr):
+        rhs = _normalize_expr(rhs, actual_span, int_dtype=DataType.FP32, float_dtype=DataType.FP32)
+    return _create_op_call(op_name, [lhs, rhs], {}, actual_span)
 
 
 def adds(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
@@ -485,7 +496,7 @@ def adds(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
         if not isinstance(rhs, Expr)
         else rhs
     )
-    return _ir_core.create_op_call("tensor.adds", [lhs, rhs_expr], {}, actual_span)
+    return _create_op_call("tensor.adds", [lhs, rhs_expr], {}, actual_span)
 
 
 def sub(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
@@ -503,17 +514,10 @@ def sub(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
         Call expression for element-wise subtraction
     """
     actual_span = _get_span_or_capture(span)
-    rhs_expr = (
-        _normalize_expr(rhs, actual_span, int_dtype=DataType.FP32, float_dtype=DataType.FP32)
-        if not isinstance(rhs, Expr)
-        else rhs
-    )
-
-    rhs_type = rhs_expr.type
-    if isinstance(rhs_type, ScalarType):
-        return _ir_core.create_op_call("tensor.subs", [lhs, rhs_expr], {}, actual_span)
-    else:
-        return _ir_core.create_op_call("tensor.sub", [lhs, rhs_expr], {}, actual_span)
+    op_name = _binary_op_name("sub", rhs)
+    if not isinstance(rhs, Expr):
+        rhs = _normalize_expr(rhs, actual_span, int_dtype=DataType.FP32, float_dtype=DataType.FP32)
+    return _create_op_call(op_name, [lhs, rhs], {}, actual_span)
 
 
 def subs(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
@@ -533,7 +537,7 @@ def subs(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
         if not isinstance(rhs, Expr)
         else rhs
     )
-    return _ir_core.create_op_call("tensor.subs", [lhs, rhs_expr], {}, actual_span)
+    return _create_op_call("tensor.subs", [lhs, rhs_expr], {}, actual_span)
 
 
 def div(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
@@ -551,17 +555,10 @@ def div(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
         Call expression for element-wise division
     """
     actual_span = _get_span_or_capture(span)
-    rhs_expr = (
-        _normalize_expr(rhs, actual_span, int_dtype=DataType.FP32, float_dtype=DataType.FP32)
-        if not isinstance(rhs, Expr)
-        else rhs
-    )
-
-    rhs_type = rhs_expr.type
-    if isinstance(rhs_type, ScalarType):
-        return _ir_core.create_op_call("tensor.divs", [lhs, rhs_expr], {}, actual_span)
-    else:
-        return _ir_core.create_op_call("tensor.div", [lhs, rhs_expr], {}, actual_span)
+    op_name = _binary_op_name("div", rhs)
+    if not isinstance(rhs, Expr):
+        rhs = _normalize_expr(rhs, actual_span, int_dtype=DataType.FP32, float_dtype=DataType.FP32)
+    return _create_op_call(op_name, [lhs, rhs], {}, actual_span)
 
 
 def divs(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
@@ -581,7 +578,7 @@ def divs(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
         if not isinstance(rhs, Expr)
         else rhs
     )
-    return _ir_core.create_op_call("tensor.divs", [lhs, rhs_expr], {}, actual_span)
+    return _create_op_call("tensor.divs", [lhs, rhs_expr], {}, actual_span)
 
 
 def part_add(lhs: Expr, rhs: Expr, span: Span | None = None) -> Call:
@@ -596,7 +593,7 @@ def part_add(lhs: Expr, rhs: Expr, span: Span | None = None) -> Call:
         Call expression for partial element-wise add
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.part_add", [lhs, rhs], {}, actual_span)
+    return _create_op_call("tensor.part_add", [lhs, rhs], {}, actual_span)
 
 
 def part_mul(lhs: Expr, rhs: Expr, span: Span | None = None) -> Call:
@@ -611,7 +608,7 @@ def part_mul(lhs: Expr, rhs: Expr, span: Span | None = None) -> Call:
         Call expression for partial element-wise multiply
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.part_mul", [lhs, rhs], {}, actual_span)
+    return _create_op_call("tensor.part_mul", [lhs, rhs], {}, actual_span)
 
 
 def part_max(lhs: Expr, rhs: Expr, span: Span | None = None) -> Call:
@@ -626,7 +623,7 @@ def part_max(lhs: Expr, rhs: Expr, span: Span | None = None) -> Call:
         Call expression for partial element-wise max
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.part_max", [lhs, rhs], {}, actual_span)
+    return _create_op_call("tensor.part_max", [lhs, rhs], {}, actual_span)
 
 
 def part_min(lhs: Expr, rhs: Expr, span: Span | None = None) -> Call:
@@ -641,7 +638,7 @@ def part_min(lhs: Expr, rhs: Expr, span: Span | None = None) -> Call:
         Call expression for partial element-wise min
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.part_min", [lhs, rhs], {}, actual_span)
+    return _create_op_call("tensor.part_min", [lhs, rhs], {}, actual_span)
 
 
 def maximum(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
@@ -665,7 +662,7 @@ def maximum(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Cal
         if not isinstance(rhs, Expr)
         else rhs
     )
-    return _ir_core.create_op_call("tensor.maximum", [lhs, rhs_expr], {}, actual_span)
+    return _create_op_call("tensor.maximum", [lhs, rhs_expr], {}, actual_span)
 
 
 def minimum(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Call:
@@ -689,7 +686,7 @@ def minimum(lhs: Expr, rhs: int | float | Expr, span: Span | None = None) -> Cal
         if not isinstance(rhs, Expr)
         else rhs
     )
-    return _ir_core.create_op_call("tensor.minimum", [lhs, rhs_expr], {}, actual_span)
+    return _create_op_call("tensor.minimum", [lhs, rhs_expr], {}, actual_span)
 
 
 def cmp(lhs: Expr, rhs: int | float | Expr, cmp_type: int = 0, span: Span | None = None) -> Call:
@@ -714,7 +711,7 @@ def cmp(lhs: Expr, rhs: int | float | Expr, cmp_type: int = 0, span: Span | None
         if not isinstance(rhs, Expr)
         else rhs
     )
-    return _ir_core.create_op_call("tensor.cmp", [lhs, rhs_expr], {"cmp_type": cmp_type}, actual_span)
+    return _create_op_call("tensor.cmp", [lhs, rhs_expr], {"cmp_type": cmp_type}, actual_span)
 
 
 def row_max(input: Expr, span: Span | None = None) -> Call:
@@ -728,7 +725,7 @@ def row_max(input: Expr, span: Span | None = None) -> Call:
         Call expression for row-wise max reduction
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_max", [input], {}, actual_span)
+    return _create_op_call("tensor.row_max", [input], {}, actual_span)
 
 
 def row_sum(input: Expr, span: Span | None = None) -> Call:
@@ -742,7 +739,7 @@ def row_sum(input: Expr, span: Span | None = None) -> Call:
         Call expression for row-wise sum reduction
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_sum", [input], {}, actual_span)
+    return _create_op_call("tensor.row_sum", [input], {}, actual_span)
 
 
 def row_min(input: Expr, span: Span | None = None) -> Call:
@@ -756,7 +753,7 @@ def row_min(input: Expr, span: Span | None = None) -> Call:
         Call expression for row-wise min reduction
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_min", [input], {}, actual_span)
+    return _create_op_call("tensor.row_min", [input], {}, actual_span)
 
 
 def row_prod(input: Expr, span: Span | None = None) -> Call:
@@ -770,7 +767,7 @@ def row_prod(input: Expr, span: Span | None = None) -> Call:
         Call expression for row-wise product reduction
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_prod", [input], {}, actual_span)
+    return _create_op_call("tensor.row_prod", [input], {}, actual_span)
 
 
 def col_sum(input: Expr, span: Span | None = None) -> Call:
@@ -786,7 +783,7 @@ def col_sum(input: Expr, span: Span | None = None) -> Call:
         Call expression for column-wise sum reduction
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_sum", [input], {}, actual_span)
+    return _create_op_call("tensor.col_sum", [input], {}, actual_span)
 
 
 def col_max(input: Expr, span: Span | None = None) -> Call:
@@ -802,7 +799,7 @@ def col_max(input: Expr, span: Span | None = None) -> Call:
         Call expression for column-wise max reduction
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_max", [input], {}, actual_span)
+    return _create_op_call("tensor.col_max", [input], {}, actual_span)
 
 
 def col_min(input: Expr, span: Span | None = None) -> Call:
@@ -818,7 +815,7 @@ def col_min(input: Expr, span: Span | None = None) -> Call:
         Call expression for column-wise min reduction
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_min", [input], {}, actual_span)
+    return _create_op_call("tensor.col_min", [input], {}, actual_span)
 
 
 def col_prod(input: Expr, span: Span | None = None) -> Call:
@@ -834,7 +831,7 @@ def col_prod(input: Expr, span: Span | None = None) -> Call:
         Call expression for column-wise product reduction
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_prod", [input], {}, actual_span)
+    return _create_op_call("tensor.col_prod", [input], {}, actual_span)
 
 
 def row_expand(target: Expr, row_vec: Expr, span: Span | None = None) -> Call:
@@ -849,7 +846,7 @@ def row_expand(target: Expr, row_vec: Expr, span: Span | None = None) -> Call:
         Call expression for row-wise expansion
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_expand", [target, row_vec], {}, actual_span)
+    return _create_op_call("tensor.row_expand", [target, row_vec], {}, actual_span)
 
 
 def row_expand_mul(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Call:
@@ -867,7 +864,7 @@ def row_expand_mul(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Cal
         Call expression for row-wise broadcast multiplication
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_expand_mul", [tensor, row_vec], {}, actual_span)
+    return _create_op_call("tensor.row_expand_mul", [tensor, row_vec], {}, actual_span)
 
 
 def row_expand_div(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Call:
@@ -885,7 +882,7 @@ def row_expand_div(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Cal
         Call expression for row-wise broadcast division
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_expand_div", [tensor, row_vec], {}, actual_span)
+    return _create_op_call("tensor.row_expand_div", [tensor, row_vec], {}, actual_span)
 
 
 def row_expand_add(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Call:
@@ -903,7 +900,7 @@ def row_expand_add(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Cal
         Call expression for row-wise broadcast addition
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_expand_add", [tensor, row_vec], {}, actual_span)
+    return _create_op_call("tensor.row_expand_add", [tensor, row_vec], {}, actual_span)
 
 
 def row_expand_sub(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Call:
@@ -921,7 +918,7 @@ def row_expand_sub(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Cal
         Call expression for row-wise broadcast subtraction
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_expand_sub", [tensor, row_vec], {}, actual_span)
+    return _create_op_call("tensor.row_expand_sub", [tensor, row_vec], {}, actual_span)
 
 
 def row_expand_max(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Call:
@@ -939,7 +936,7 @@ def row_expand_max(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Cal
         Call expression for row-wise broadcast maximum
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_expand_max", [tensor, row_vec], {}, actual_span)
+    return _create_op_call("tensor.row_expand_max", [tensor, row_vec], {}, actual_span)
 
 
 def row_expand_min(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Call:
@@ -957,7 +954,7 @@ def row_expand_min(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Cal
         Call expression for row-wise broadcast minimum
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_expand_min", [tensor, row_vec], {}, actual_span)
+    return _create_op_call("tensor.row_expand_min", [tensor, row_vec], {}, actual_span)
 
 
 def row_expand_expdif(tensor: Expr, row_vec: Expr, span: Span | None = None) -> Call:
@@ -974,7 +971,7 @@ def row_expand_expdif(tensor: Expr, row_vec: Expr, span: Span | None = None) ->
         Call expression for row-wise exp-diff
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.row_expand_expdif", [tensor, row_vec], {}, actual_span)
+    return _create_op_call("tensor.row_expand_expdif", [tensor, row_vec], {}, actual_span)
 
 
 def col_expand_mul(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Call:
@@ -992,7 +989,7 @@ def col_expand_mul(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Cal
         Call expression for column-wise broadcast multiplication
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_expand_mul", [tensor, col_vec], {}, actual_span)
+    return _create_op_call("tensor.col_expand_mul", [tensor, col_vec], {}, actual_span)
 
 
 def col_expand(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Call:
@@ -1007,7 +1004,7 @@ def col_expand(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Call:
         Call expression for column-wise expansion
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_expand", [tensor, col_vec], {}, actual_span)
+    return _create_op_call("tensor.col_expand", [tensor, col_vec], {}, actual_span)
 
 
 def col_expand_sub(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Call:
@@ -1025,7 +1022,7 @@ def col_expand_sub(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Cal
         Call expression for column-wise broadcast subtraction
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_expand_sub", [tensor, col_vec], {}, actual_span)
+    return _create_op_call("tensor.col_expand_sub", [tensor, col_vec], {}, actual_span)
 
 
 def col_expand_max(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Call:
@@ -1042,7 +1039,7 @@ def col_expand_max(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Cal
         Call expression for column-wise broadcast maximum
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_expand_max", [tensor, col_vec], {}, actual_span)
+    return _create_op_call("tensor.col_expand_max", [tensor, col_vec], {}, actual_span)
 
 
 def col_expand_min(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Call:
@@ -1059,7 +1056,7 @@ def col_expand_min(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Cal
         Call expression for column-wise broadcast minimum
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_expand_min", [tensor, col_vec], {}, actual_span)
+    return _create_op_call("tensor.col_expand_min", [tensor, col_vec], {}, actual_span)
 
 
 def col_expand_expdif(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Call:
@@ -1076,7 +1073,7 @@ def col_expand_expdif(tensor: Expr, col_vec: Expr, span: Span | None = None) ->
         Call expression for column-wise exp-diff
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_expand_expdif", [tensor, col_vec], {}, actual_span)
+    return _create_op_call("tensor.col_expand_expdif", [tensor, col_vec], {}, actual_span)
 
 
 def col_expand_div(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Call:
@@ -1094,7 +1091,7 @@ def col_expand_div(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Cal
         Call expression for column-wise broadcast division
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_expand_div", [tensor, col_vec], {}, actual_span)
+    return _create_op_call("tensor.col_expand_div", [tensor, col_vec], {}, actual_span)
 
 
 def col_expand_add(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Call:
@@ -1112,7 +1109,7 @@ def col_expand_add(tensor: Expr, col_vec: Expr, span: Span | None = None) -> Cal
         Call expression for column-wise broadcast addition
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.col_expand_add", [tensor, col_vec], {}, actual_span)
+    return _create_op_call("tensor.col_expand_add", [tensor, col_vec], {}, actual_span)
 
 
 def expands(target: Expr, scalar: int | float | Expr, span: Span | None = None) -> Call:
@@ -1132,7 +1129,7 @@ def expands(target: Expr, scalar: int | float | Expr, span: Span | None = None)
         if not isinstance(scalar, Expr)
         else scalar
     )
-    return _ir_core.create_op_call("tensor.expands", [target, scalar_expr], {}, actual_span)
+    return _create_op_call("tensor.expands", [target, scalar_expr], {}, actual_span)
 
 
 def expand_clone(
@@ -1151,7 +1148,7 @@ def expand_clone(
         Call expression for tensor expand_clone
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.expand_clone", [src, target], {}, actual_span)
+    return _create_op_call("tensor.expand_clone", [src, target], {}, actual_span)
 
 
 def exp(input: Expr, span: Span | None = None) -> Call:
@@ -1165,7 +1162,7 @@ def exp(input: Expr, span: Span | None = None) -> Call:
         Call expression for element-wise exponential
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.exp", [input], {}, actual_span)
+    return _create_op_call("tensor.exp", [input], {}, actual_span)
 
 
 def log(input: Expr, span: Span | None = None) -> Call:
@@ -1179,7 +1176,7 @@ def log(input: Expr, span: Span | None = None) -> Call:
         Call expression for element-wise natural logarithm
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.log", [input], {}, actual_span)
+    return _create_op_call("tensor.log", [input], {}, actual_span)
 
 
 def sin(input: Expr, span: Span | None = None) -> Call:
@@ -1193,7 +1190,7 @@ def sin(input: Expr, span: Span | None = None) -> Call:
         Call expression for element-wise sine
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.sin", [input], {}, actual_span)
+    return _create_op_call("tensor.sin", [input], {}, actual_span)
 
 
 def cos(input: Expr, span: Span | None = None) -> Call:
@@ -1207,7 +1204,7 @@ def cos(input: Expr, span: Span | None = None) -> Call:
         Call expression for element-wise cosine
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.cos", [input], {}, actual_span)
+    return _create_op_call("tensor.cos", [input], {}, actual_span)
 
 
 def neg(input: Expr, span: Span | None = None) -> Call:
@@ -1221,7 +1218,7 @@ def neg(input: Expr, span: Span | None = None) -> Call:
         Call expression for element-wise negation
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.neg", [input], {}, actual_span)
+    return _create_op_call("tensor.neg", [input], {}, actual_span)
 
 
 def abs(input: Expr, span: Span | None = None) -> Call:
@@ -1235,7 +1232,7 @@ def abs(input: Expr, span: Span | None = None) -> Call:
         Call expression for element-wise absolute value
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.abs", [input], {}, actual_span)
+    return _create_op_call("tensor.abs", [input], {}, actual_span)
 
 
 def recip(input: Expr, span: Span | None = None) -> Call:
@@ -1249,7 +1246,7 @@ def recip(input: Expr, span: Span | None = None) -> Call:
         Call expression for element-wise reciprocal
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.recip", [input], {}, actual_span)
+    return _create_op_call("tensor.recip", [input], {}, actual_span)
 
 
 def sqrt(input: Expr, span: Span | None = None) -> Call:
@@ -1263,7 +1260,7 @@ def sqrt(input: Expr, span: Span | None = None) -> Call:
         Call expression for element-wise square root
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.sqrt", [input], {}, actual_span)
+    return _create_op_call("tensor.sqrt", [input], {}, actual_span)
 
 
 def rsqrt(input: Expr, high_precision: bool = False, span: Span | None = None) -> Call:
@@ -1280,7 +1277,7 @@ def rsqrt(input: Expr, high_precision: bool = False, span: Span | None = None) -
     """
     actual_span = _get_span_or_capture(span)
     kwargs: dict = {"high_precision": high_precision} if high_precision else {}
-    return _ir_core.create_op_call("tensor.rsqrt", [input], kwargs, actual_span)
+    return _create_op_call("tensor.rsqrt", [input], kwargs, actual_span)
 
 
 def cast(
@@ -1311,7 +1308,7 @@ def cast(
         "mode": mode_val,
     }
 
-    return _ir_core.create_op_call("tensor.cast", args, kwargs, actual_span)
+    return _create_op_call("tensor.cast", args, kwargs, actual_span)
 
 
 def assemble(
@@ -1342,7 +1339,7 @@ def assemble(
 
     args = [target, source, offset_tuple]
     kwargs: dict[str, Any] = {"atomic": atomic} if atomic else {}
-    return _ir_core.create_op_call("tensor.assemble", args, kwargs, actual_span)
+    return _create_op_call("tensor.assemble", args, kwargs, actual_span)
 
 
 def concat(
@@ -1361,7 +1358,7 @@ def concat(
         Call expression for column-wise concatenation
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.concat", [src0, src1], {}, actual_span)
+    return _create_op_call("tensor.concat", [src0, src1], {}, actual_span)
 
 
 def reshape(
@@ -1388,7 +1385,7 @@ def reshape(
     args = [tensor, shape_tuple]
     if valid_shape is not None:
         args.append(_to_make_tuple(valid_shape, actual_span))
-    return _ir_core.create_op_call("tensor.reshape", args, {}, actual_span)
+    return _create_op_call("tensor.reshape", args, {}, actual_span)
 
 
 def transpose(
@@ -1428,7 +1425,7 @@ def transpose(
     args = [tensor, axis1_expr, axis2_expr]
     if valid_shape is not None:
         args.append(_to_make_tuple(valid_shape, actual_span))
-    return _ir_core.create_op_call("tensor.transpose", args, {}, actual_span)
+    return _create_op_call("tensor.transpose", args, {}, actual_span)
 
 
 def as_layout(
@@ -1470,7 +1467,7 @@ def as_layout(
     """
     actual_span = _get_span_or_capture(span)
     kwargs: dict[str, Any] = {"layout": layout}
-    return _ir_core.create_op_call("tensor.as_layout", [tensor], kwargs, actual_span)
+    return _create_op_call("tensor.as_layout", [tensor], kwargs, actual_span)
 
 
 def set_validshape(
@@ -1501,7 +1498,7 @@ def set_validshape(
     vc_expr = (
         valid_cols if isinstance(valid_cols, Expr) else ConstInt(valid_cols, DataType.INDEX, actual_span)
     )
-    return _ir_core.create_op_call("tensor.set_validshape", [tensor, vr_expr, vc_expr], {}, actual_span)
+    return _create_op_call("tensor.set_validshape", [tensor, vr_expr, vc_expr], {}, actual_span)
 
 
 def scatter_update(
@@ -1564,7 +1561,7 @@ def scatter_update(
         raise TypeError(f"src must be Expr, got {type(src)}")
     op_args: list[Expr] = [input, index, src]
     kwargs: dict[str, Any] = {"dim": dim_val}
-    return _ir_core.create_op_call("tensor.scatter_update", op_args, kwargs, actual_span)
+    return _create_op_call("tensor.scatter_update", op_args, kwargs, actual_span)
 
 
 # ============================================================================
@@ -1588,7 +1585,7 @@ def sort32(src: Expr, idx: Expr, span: Span | None = None) -> Call:
         Call expression returning sorted tensor with doubled last dimension
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.sort32", [src, idx], {}, actual_span)
+    return _create_op_call("tensor.sort32", [src, idx], {}, actual_span)
 
 
 def mrgsort(
@@ -1637,7 +1634,7 @@ def mrgsort(
             block_len_expr = block_len
         else:
             block_len_expr = _ir_core.ConstInt(block_len, DataType.INT32, actual_span)
-        return _ir_core.create_op_call("tensor.mrgsort_format1", [src0, block_len_expr], {}, actual_span)
+        return _create_op_call("tensor.mrgsort_format1", [src0, block_len_expr], {}, actual_span)
     # format2: 2-4 way merge
     if src1 is None:
         raise ValueError(
@@ -1652,7 +1649,7 @@ def mrgsort(
         args = [src0, src1, src2]
     else:
         args = [src0, src1, src2, src3]
-    return _ir_core.create_op_call("tensor.mrgsort_format2", args, kwargs, actual_span)
+    return _create_op_call("tensor.mrgsort_format2", args, kwargs, actual_span)
 
 
 def mrgsort_format1(src0: Expr, block_len: int | Expr, span: Span | None = None) -> Call:
@@ -1765,7 +1762,7 @@ def gather(  # noqa: PLR0913
         kwargs: dict[str, Any] = {"mask_pattern": mask_pattern}
         if output_dtype is not None:
             kwargs["output_dtype"] = output_dtype
-        return _ir_core.create_op_call("tensor.gather_mask", [input], kwargs, actual_span)
+        return _create_op_call("tensor.gather_mask", [input], kwargs, actual_span)
     if is_compare:
         if kvalue is None or cmp_mode is None or out_cols is None:
             raise ValueError("gather() compare form requires kvalue, cmp_mode and out_cols all set")
@@ -1778,7 +1775,7 @@ def gather(  # noqa: PLR0913
         }
         if count_dtype is not None:
             cmp_kwargs["count_dtype"] = count_dtype
-        return _ir_core.create_op_call("tensor.gather_compare", [input, kvalue], cmp_kwargs, actual_span)
+        return _create_op_call("tensor.gather_compare", [input, kvalue], cmp_kwargs, actual_span)
     if not is_index:
         raise ValueError(
             "gather() requires (dim, index) for index form, mask_pattern=<int> for mask form, "
@@ -1794,7 +1791,7 @@ def gather(  # noqa: PLR0913
         dim_val = dim
     else:
         raise TypeError(f"dim must be int or ConstInt, got {type(dim)}")
-    return _ir_core.create_op_call("tensor.gather", [input, index], {"dim": dim_val}, actual_span)
+    return _create_op_call("tensor.gather", [input, index], {"dim": dim_val}, actual_span)
 
 
 def gather_mask(
@@ -1900,7 +1897,7 @@ def paged_gather(  # noqa: PLR0913
         "is_b_matrix": is_b_matrix,
         "space": space,
     }
-    return _ir_core.create_op_call("tensor.paged_gather", [src, indices, block_table], kwargs, actual_span)
+    return _create_op_call("tensor.paged_gather", [src, indices, block_table], kwargs, actual_span)
 
 
 def create_l1(
@@ -1929,7 +1926,7 @@ def create_l1(
     """
     actual_span = _get_span_or_capture(span)
     shape_tuple = _to_make_tuple(shape, actual_span)
-    return _ir_core.create_op_call(
+    return _create_op_call(
         "tensor.create_l1", [shape_tuple], {"dtype": dtype, "transpose": transpose}, actual_span
     )
 
@@ -1969,7 +1966,7 @@ def gather_row(  # noqa: PLR0913
     dst_off = _to_make_tuple(dst_offset, actual_span)
     src_off = _to_make_tuple(src_offset, actual_span)
     shapes_tuple = _to_make_tuple(shapes, actual_span)
-    return _ir_core.create_op_call(
+    return _create_op_call(
         "tensor.gather_row", [acc, src, dst_off, src_off, shapes_tuple], {"transpose": transpose}, actual_span
     )
 
@@ -2032,7 +2029,7 @@ def scatter(  # noqa: PLR0913
     if is_mask:
         if mask_pattern is None or dst is None:
             raise ValueError("scatter() mask form requires both mask_pattern and dst")
-        return _ir_core.create_op_call(
+        return _create_op_call(
             "tensor.scatter_mask", [input, dst], {"mask_pattern": mask_pattern}, actual_span
         )
     if not is_index:
@@ -2042,7 +2039,7 @@ def scatter(  # noqa: PLR0913
         )
     if dim is None or index is None or src is None:
         raise ValueError("scatter() index form requires dim, index and src")
-    return _ir_core.create_op_call("tensor.scatter", [input, index, src], {"dim": dim}, actual_span)
+    return _create_op_call("tensor.scatter", [input, index, src], {"dim": dim}, actual_span)
 
 
 def scatter_mask(
@@ -2074,7 +2071,7 @@ def get_block_idx(span: Span | None = None) -> Call:
         Call expression that returns an INDEX scalar representing the block index
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.get_block_idx", [], {}, actual_span)
+    return _create_op_call("tensor.get_block_idx", [], {}, actual_span)
 
 
 def get_subblock_idx(span: Span | None = None) -> Call:
@@ -2089,7 +2086,7 @@ def get_subblock_idx(span: Span | None = None) -> Call:
         Call expression that returns an INDEX scalar representing the sub-block index
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.get_subblock_idx", [], {}, actual_span)
+    return _create_op_call("tensor.get_subblock_idx", [], {}, actual_span)
 
 
 def get_block_num(span: Span | None = None) -> Call:
@@ -2104,4 +2101,4 @@ def get_block_num(span: Span | None = None) -> Call:
         Call expression that returns an INDEX scalar representing the total block count
     """
     actual_span = _get_span_or_capture(span)
-    return _ir_core.create_op_call("tensor.get_block_num", [], {}, actual_span)
+    return _create_op_call("tensor.get_block_num", [], {}, actual_span)
@@ -2391,7 +2391,7 @@ def slice(
         # `drop_dims` may be ints (direct API) or ConstInt exprs (text parser);
         # _to_make_tuple normalizes either form. Non-ConstInt exprs are rejected
         # by the deducer with a clear message.
-        args.append(_to_make_tuple(list(drop_dims), actual_span))
+        args.append(_to_make_tuple(drop_dims, actual_span))
     elif valid_shape_tuple is not None:
         args.append(valid_shape_tuple)
 
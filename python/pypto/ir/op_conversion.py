@@ -15,12 +15,14 @@ Provides:
 - register_op_conversion: Simple name mapping registration
 """
 
+import functools
 from collections.abc import Callable
 from typing import Any
 
 from pypto.pypto_core.ir import (
     AssignStmt,
     Expr,
+    MemorySpace,
     Span,
     Stmt,
     Var,
@@ -32,27 +34,59 @@ from pypto.pypto_core.ir import (
     register_op_conversion_custom as _register_custom,
 )
 
+from .op import tile_ops
+
 
 class ConversionContext:
     """Lightweight builder for conversion rules. Accumulates prologue statements."""
 
+    __slots__ = ("_stmts", "_span")
+
     def __init__(self, span: Span) -> None:
-        self._stmts: list[Stmt] = []
+        # Created on first let()/emit(): most conversions emit no prologue.
+        self._stmts: list[Stmt] | None = None
         self._span = span
 
     def let(self, name: str, value: Expr) -> Var:
         """Create variable, assign value, emit AssignStmt. Returns the Var."""
         var = Var(name, value.type, self._span)
-        self._stmts.append(AssignStmt(var, value, self._span))
+        stmt = AssignStmt(var, value, self._span)
+        if self._stmts is None:
+            self._stmts = [stmt]
+        else:
+            self._stmts.append(stmt)
         return var
 
+    def move_let(self, name: str, tile: Expr, target_memory: MemorySpace) -> Var:
+        """Move a tile to target_memory and bind the result. Returns the Var."""
+        return self.let(name, tile_ops.move(tile, target_memory=target_memory, span=self._span))
+
     def emit(self, stmt: Stmt) -> None:
         """Emit a raw statement into the prologue."""
-        self._stmts.append(stmt)
+        if self._stmts is None:
+            self._stmts = [stmt]
+        else:
+            self._stmts.append(stmt)
 
     @property
     def stmts(self) -> list[Stmt]:
-        return list(self._stmts)
+        """Prologue statements emitted so far. Returned without copying; do not mutate."""
+        return [] if self._stmts is None else self._stmts
+
+
+def _run_conversion(
+    func: Callable, args: list[Expr], kwargs: dict[str, Any], span: Span
+) -> Expr | tuple[list[Stmt], Expr]:
+    """Invoke a decorated conversion and shape its result for the registry.
+
+    Reads ``ctx._stmts`` directly: the list is handed to the C++ registry,
+    which copies it into a ``std::vector`` and never retains the Python list.
+    """
+    ctx = ConversionContext(span)
+    result = func(ctx, args, kwargs, span)
+    if ctx._stmts is not None:
+        return (ctx._stmts, result)
+    return result
 
 
 def register_op_conversion(from_op: str, to_op: str) -> None:
@@ -65,37 +99,35 @@ def register_op_conversion(from_op: str, to_op: str) -> None:
     _register_simple(from_op, to_op)
 
 
-def op_conversion(from_op: str) -> Callable:
+def op_conversion(from_op: str, *, pure: bool = False) -> Callable:
     """Decorator for registering custom conversion functions.
 
     The decorated function receives (ctx, args, kwargs, span) where:
     - ctx: ConversionContext for accumulating prologue statements
+      (None when registered with ``pure=True``)
     - args: list[Expr] — substituted positional arguments
-    - kwargs: list[tuple[str, Any]] — keyword arguments
+    - kwargs: dict[str, Any] — keyword arguments
     - span: Span — source location
 
     It should return an Expr (the result expression).
 
+    Pass ``pure=True`` for converters that never call ``ctx.let``/``ctx.emit``;
+    they are invoked directly, without allocating a ConversionContext.
+
     Example::
 
         @op_conversion("tensor.matmul")
         def convert_matmul(ctx, args, kwargs, span):
-            lhs_l0a = ctx.let("lhs_l0a", tile_ops.move(args[0], target_memory=MemorySpace.Left))
-            rhs_l0b = ctx.let("rhs_l0b", tile_ops.move(args[1], target_memory=MemorySpace.Right))
+            lhs_l0a = ctx.move_let("lhs_l0a", args[0], MemorySpace.Left)
+            rhs_l0b = ctx.move_let("rhs_l0b", args[1], MemorySpace.Right)
             return tile_ops.matmul(lhs_l0a, rhs_l0b)
     """
 
     def decorator(func: Callable) -> Callable:
-        def wrapper(
-            args: list[Expr], kwargs: list[tuple[str, Any]], span: Span
-        ) -> Expr | tuple[list[Stmt], Expr]:
-            ctx = ConversionContext(span)
-            result = func(ctx, args, kwargs, span)
-            if ctx.stmts:
-                return (ctx.stmts, result)
-            return result
-
-        _register_custom(from_op, wrapper)
+        if pure:
+            _register_custom(from_op, functools.partial(func, None))
+        else:
+            _register_custom(from_op, functools.partial(_run_conversion, func))
         return func
 
     return decorator
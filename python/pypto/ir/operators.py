@@ -13,7 +13,8 @@ import inspect
 
 from pypto.pypto_core import ir as _ir
 
-from .utils import _normalize_expr
+from . import utils as _utils
+from .utils import _UNKNOWN_SPAN, _normalize_expr
 
 
 def _capture_call_span() -> _ir.Span:
@@ -24,6 +25,9 @@ def _capture_call_span() -> _ir.Span:
     Returns:
         Span: Source location of the caller
     """
+    if not _utils._SPAN_CAPTURE_ENABLED:
+        return _UNKNOWN_SPAN
+
     # Go back through frames to find user code:
     # frame 0 = _capture_call_span
     # frame 1 = our wrapper (e.g., __add__)
@@ -33,10 +37,9 @@ def _capture_call_span() -> _ir.Span:
         frame = frame.f_back.f_back
 
     if frame is not None:
-        info = inspect.getframeinfo(frame)
-        return _ir.Span(info.filename, info.lineno, -1)
+        return _ir.Span(frame.f_code.co_filename, frame.f_lineno, -1)
 
-    return _ir.Span.unknown()
+    return _UNKNOWN_SPAN
 
 
 def _make_binary_op(op_name: str):
@@ -10,6 +10,7 @@
 """Utility functions for IR construction."""
 
 import inspect
+import os
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from contextvars import ContextVar
@@ -23,6 +24,36 @@ from pypto.pypto_core import ir as _ir
 # call-site span rather than the wrapper file's own line.
 _PARSER_SPAN: ContextVar[_ir.Span | None] = ContextVar("_PARSER_SPAN", default=None)
 
+# Whether implicit spans are captured from the caller's frame. Read at call time
+# by ``_get_span_or_capture``, the operator overloads and ``IRBuilder``.
+# Disabled via ``PYPTO_NO_SPANS=1`` (or ``set_span_capture(False)``) for
+# production builds that never surface source locations.
+_SPAN_CAPTURE_ENABLED = os.environ.get("PYPTO_NO_SPANS", "").strip().lower() not in ("1", "true", "yes")
+
+# Shared fallback span. Span is read-only from Python and IR constructors copy
+# it, so one instance serves every builder that has no location to attach.
+_UNKNOWN_SPAN = _ir.Span.unknown()
+
+
+def set_span_capture(enabled: bool) -> bool:
+    """Enable or disable call-site span capture for IR builders.
+
+    When disabled, op builders, expression operator overloads and ``IRBuilder``
+    methods called without an explicit span (and outside the DSL parser)
+    attach ``Span.unknown()`` instead of inspecting the caller's frame.
+    Explicit and parser-pinned spans are unaffected.
+
+    Args:
+        enabled: Whether to capture call-site spans
+
+    Returns:
+        The previous setting, so callers can restore it
+    """
+    global _SPAN_CAPTURE_ENABLED  # noqa: PLW0603
+    previous = _SPAN_CAPTURE_ENABLED
+    _SPAN_CAPTURE_ENABLED = enabled
+    return previous
+
 
 @contextmanager
 def use_parser_span(span: _ir.Span) -> Iterator[None]:
@@ -40,7 +71,8 @@ def _get_span_or_capture(span: _ir.Span | None = None, frame_offset: int = 1) ->
     Resolution order:
       1. Explicit ``span`` argument when provided.
       2. ``_PARSER_SPAN`` contextvar (set by the DSL parser).
-      3. Frame capture from ``frame_offset`` levels up the Python stack.
+      3. Frame capture from ``frame_offset`` levels up the Python stack,
+         unless disabled via ``set_span_capture(False)``.
 
     Args:
         span: Explicit span if provided
@@ -56,6 +88,9 @@ def _get_span_or_capture(span: _ir.Span | None = None, frame_offset: int = 1) ->
     if parser_span is not None:
         return parser_span
 
+    if not _SPAN_CAPTURE_ENABLED:
+        return _UNKNOWN_SPAN
+
     frame = inspect.currentframe()
     if frame is not None:
         frame = frame.f_back
@@ -66,10 +101,12 @@ def _get_span_or_capture(span: _ir.Span | None = None, frame_offset: int = 1) ->
         frame = frame.f_back
 
     if frame is not None:
-        info = inspect.getframeinfo(frame)
-        return _ir.Span(info.filename, info.lineno, -1)
+        # Read the location straight off the frame: ``inspect.getframeinfo``
+        # also loads source context through linecache, which dominates the
+        # cost of building small IR nodes.
+        return _ir.Span(frame.f_code.co_filename, frame.f_lineno, -1)
 
-    return _ir.Span.unknown()
+    return _UNKNOWN_SPAN
 
 
 def _normalize_expr(
@@ -95,7 +132,7 @@ def _normalize_expr(
     if isinstance(value, _ir.Expr):
         return value
 
-    actual_span = span if span is not None else _ir.Span.unknown()
+    actual_span = span if span is not None else _UNKNOWN_SPAN
 
     if isinstance(value, int):
         return _ir.ConstInt(value, int_dtype, actual_span)
@@ -140,8 +177,9 @@ def _to_make_tuple(
     """
     if isinstance(value, _ir.MakeTuple):
         return value
-    actual_span = span if span is not None else _ir.Span.unknown()
-    elements = [_normalize_expr(v, actual_span) for v in value]
+    actual_span = span if span is not None else _UNKNOWN_SPAN
+    # Forward existing Exprs inline; only Python literals need normalizing.
+    elements = [v if isinstance(v, _ir.Expr) else _normalize_expr(v, actual_span) for v in value]
     return _ir.MakeTuple(elements, actual_span)
 
 
@@ -155,6 +193,8 @@ CAST_MODE_NAMES: dict[str, int] = {
     "odd": 6,
 }
 
+_MAX_CAST_MODE = max(CAST_MODE_NAMES.values())
+
 
 def resolve_cast_mode(mode: str | int) -> int:
     """Resolve cast mode to int, accepting both string names and int values.
@@ -170,15 +210,16 @@ def resolve_cast_mode(mode: str | int) -> int:
         ValueError: If mode is not a valid name or is out of range [0, 6]
     """
     if isinstance(mode, bool):
-        raise ValueError(f"Invalid rounding mode {mode!r}. Expected str name or int in range [0, 6].")
+        raise ValueError(
+            f"Invalid rounding mode {mode!r}. Expected str name or int in range [0, {_MAX_CAST_MODE}]."
+        )
     if isinstance(mode, int):
-        max_mode = max(CAST_MODE_NAMES.values())
-        if not 0 <= mode <= max_mode:
-            raise ValueError(f"Invalid rounding mode {mode}. Expected int in range [0, {max_mode}].")
+        if not 0 <= mode <= _MAX_CAST_MODE:
+            raise ValueError(f"Invalid rounding mode {mode}. Expected int in range [0, {_MAX_CAST_MODE}].")
         return mode
     mode_val = CAST_MODE_NAMES.get(mode)
     if mode_val is None:
-        raise ValueError(f"Invalid rounding mode '{mode}'. Expected one of {list(CAST_MODE_NAMES.keys())}.")
+        raise ValueError(f"Invalid rounding mode '{mode}'. Expected one of {list(CAST_MODE_NAMES)}.")
     return mode_val
 
 
@@ -189,5 +230,6 @@ __all__ = [
     "_normalize_shape",
     "_to_make_tuple",
     "resolve_cast_mode",
+    "set_span_capture",
     "use_parser_span",
 ]
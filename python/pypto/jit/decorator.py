@@ -403,7 +403,7 @@ def _get_pl_dtype_map() -> dict[str, Any]:
         from pypto.pypto_core import DataType as _DataType  # noqa: PLC0415
 
         _PL_DTYPE_MAP.update(
-            {name: getattr(_pl, name) for name in dir(_pl) if isinstance(getattr(_pl, name), _DataType)}
+            {name: value for name, value in vars(_pl).items() if isinstance(value, _DataType)}
         )
     return _PL_DTYPE_MAP
 
@@ -27,6 +27,7 @@ from pypto.language.op import array_ops as _dsl_array
 from pypto.language.op import system_ops as _dsl_system
 from pypto.language.op import tensor_ops as _dsl_tensor
 from pypto.language.op import tile_ops as _dsl_tile
+from pypto.language.typing.scalar import scalar_type
 from pypto.pypto_core import DataType, ir
 from pypto.pypto_core import arith as _arith
 
@@ -2180,7 +2181,7 @@ class ASTParser:
                     break
         if _loop_var_dtype == DataType.INDEX and saw_int64_bound and not saw_index_bound:
             _loop_var_dtype = DataType.INT64
-        loop_var = self.builder.var(loop_var_name, ir.ScalarType(_loop_var_dtype))
+        loop_var = self.builder.var(loop_var_name, scalar_type(_loop_var_dtype))
         span = self.span_tracker.get_span(stmt)
         loop_output_vars: list[str] = []
         prev_loop_builder = self.current_loop_builder
@@ -3863,7 +3864,7 @@ class ASTParser:
         scope_attrs: list[tuple[str, Any]] = []
         if dep_vars:
             scope_attrs.append(("manual_dep_edges", dep_vars))
-        tid_var = self.builder.var(optional_vars.id, ir.ScalarType(DataType.TASK_ID), span=span)
+        tid_var = self.builder.var(optional_vars.id, scalar_type(DataType.TASK_ID), span=span)
         self.scope_manager.define_var(optional_vars.id, tid_var, span=span)
         scope_attrs.append(("task_id_var", tid_var))
         # ``allow_early_resolve`` last (canonical order) — the Spmd outliner reads
@@ -4014,7 +4015,7 @@ class ASTParser:
                     with self._scope_kind_context(ir.ScopeKind.InCore):
                         # Bind `i = pl.tile.get_block_idx()` as the first
                         # statement of the outlined InCore body.
-                        loop_var = self.builder.var(loop_var_name, ir.ScalarType(DataType.INDEX), span=span)
+                        loop_var = self.builder.var(loop_var_name, scalar_type(DataType.INDEX), span=span)
                         self.scope_manager.define_var(loop_var_name, loop_var)
                         self.builder.assign(loop_var, ir_op.tile.get_block_idx(span=span), span=span)
                         self._parse_body_siblings(stmt.body)
@@ -4327,7 +4328,7 @@ class ASTParser:
                     span=span,
                     hint="Use `with pl.at(...) as tid:` (single name; nested tuples are not allowed).",
                 )
-            tid_var = self.builder.var(optional_vars.id, ir.ScalarType(DataType.TASK_ID), span=span)
+            tid_var = self.builder.var(optional_vars.id, scalar_type(DataType.TASK_ID), span=span)
             self.scope_manager.define_var(optional_vars.id, tid_var, span=span)
             attrs.append(("task_id_var", tid_var))
 
@@ -5855,7 +5856,7 @@ class ASTParser:
             # manual_dep_edges. The return type is still the flat
             # Tuple{*<kernel results>, TaskId} so tuple projection of the
             # producer TaskId continues to work the same way as before.
-            return_type = ir.TupleType([*return_types, ir.ScalarType(DataType.TASK_ID)])
+            return_type = ir.TupleType([*return_types, scalar_type(DataType.TASK_ID)])
             deps_list: list[ir.Expr] = list(user_dep_vars) if user_dep_vars else []
             # deps live only on Submit::deps_; attrs never carries
             # manual_dep_edges (ManualDepsOnSubmitOnly invariant).
@@ -10,17 +10,19 @@
 """Centralized expression evaluator for resolving Python expressions against closure variables."""
 
 import ast
+import types
 from typing import TYPE_CHECKING, Any, cast
 
 from pypto.pypto_core import DataType, ir
 
 from ..typing.dynamic import DynVar
-from ..typing.scalar import Scalar
+from ..typing.scalar import Scalar, scalar_type
 from .diagnostics import ParserTypeError
 
 if TYPE_CHECKING:
     from .span_tracker import SpanTracker
 
+
 # Safe subset of builtins allowed during expression evaluation
 _SAFE_BUILTINS: dict[str, Any] = {
     "len": len,
@@ -42,6 +44,9 @@ _SAFE_BUILTINS: dict[str, Any] = {
     "None": None,
 }
 
+# Shared globals for every eval(); expressions cannot bind globals, so reuse is safe.
+_EVAL_GLOBALS: dict[str, Any] = {"__builtins__": _SAFE_BUILTINS}
+
 
 class ExprEvaluator:
     """Evaluates Python AST expressions against closure variables.
@@ -64,6 +69,8 @@ class ExprEvaluator:
         self.closure_vars = closure_vars
         self.span_tracker = span_tracker
         self.dynvar_cache: dict[str, ir.Var] = {}
+        # Keyed on the node object (not id()) so a cached node cannot be freed and its id reused.
+        self._code_cache: dict[ast.expr, types.CodeType] = {}
 
     def eval_expr(self, node: ast.expr) -> Any:
         """Evaluate an AST expression node against closure variables.
@@ -77,27 +84,39 @@ class ExprEvaluator:
         Raises:
             ParserTypeError: If expression cannot be evaluated
         """
-        span = self._get_span(node)
-        expr_str = ast.unparse(node)
+        # Fast paths for the most common annotation forms: literals and bare closure names.
+        node_type = type(node)
+        if node_type is ast.Constant:
+            return cast(ast.Constant, node).value
+        if node_type is ast.Name:
+            name = cast(ast.Name, node).id
+            if name in self.closure_vars:
+                return self.closure_vars[name]
+            # Same resolution order as eval(): closure (locals), then whitelisted builtins.
+            if name in _SAFE_BUILTINS:
+                return _SAFE_BUILTINS[name]
 
         try:
-            code = compile(ast.Expression(body=node), "<pypto-eval>", "eval")
+            code = self._code_cache.get(node)
+            if code is None:
+                code = compile(ast.Expression(body=node), "<pypto-eval>", "eval")
+                self._code_cache[node] = code
             # Security note: closure_vars come from the user's own enclosing Python scope.
             # The DSL parser is not a sandbox — users already have full control of the
             # Python process. The builtins whitelist prevents accidental access to dangerous
             # builtins (open, __import__, exec) but does not prevent calling methods on
             # objects the user placed in scope, which is by design.
-            return eval(code, {"__builtins__": _SAFE_BUILTINS}, dict(self.closure_vars))  # noqa: S307
+            return eval(code, _EVAL_GLOBALS, dict(self.closure_vars))  # noqa: S307
         except NameError as e:
             raise ParserTypeError(
-                f"Cannot resolve expression '{expr_str}': {e}",
-                span=span,
+                f"Cannot resolve expression '{ast.unparse(node)}': {e}",
+                span=self._get_span(node),
                 hint="Make sure the variable is defined in the enclosing scope",
             ) from e
         except Exception as e:
             raise ParserTypeError(
-                f"Failed to evaluate expression '{expr_str}': {e}",
-                span=span,
+                f"Failed to evaluate expression '{ast.unparse(node)}': {e}",
+                span=self._get_span(node),
             ) from e
 
     def try_eval_expr(self, node: ast.expr) -> tuple[bool, Any]:
@@ -167,7 +186,7 @@ class ExprEvaluator:
         # call arguments resolve to the same Var instance, creating it with
         # the call-site span (DynVar.unwrap() would use Span.unknown()).
         if dv._ir_var is None:
-            dv._ir_var = ir.Var(dv.name, ir.ScalarType(DataType.INDEX), span)
+            dv._ir_var = ir.Var(dv.name, scalar_type(DataType.INDEX), span)
         var = cast(ir.Var, dv.unwrap())
         self.dynvar_cache[dv.name] = var
         return var
@@ -15,7 +15,7 @@ from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any, cast
 
 from pypto.language.typing.dynamic import DynVar
-from pypto.language.typing.scalar import Scalar
+from pypto.language.typing.scalar import Scalar, scalar_type
 from pypto.pypto_core import DataType, ir
 
 from .diagnostics import ParserTypeError
@@ -358,7 +358,7 @@ class TypeResolver:
 
         if type_name == "Scalar":
             dtype = self.resolve_dtype(slice_value)
-            return ir.ScalarType(dtype)
+            return scalar_type(dtype)
 
         if type_name == "Array":
             # pl.Array[N, dtype] — N is an int literal, dtype is a DataType ref.
@@ -693,7 +693,7 @@ class TypeResolver:
         dtype = self.resolve_dtype(dtype_node)
 
         # Create ScalarType
-        return ir.ScalarType(dtype)
+        return scalar_type(dtype)
 
     def _resolve_tuple_subscript_type(self, subscript_node: ast.Subscript) -> ir.TupleType:
         """Resolve pl.Tuple[T1, T2, ...] or pl.Tuple[()] annotation to ir.TupleType."""
@@ -799,7 +799,7 @@ class TypeResolver:
                 if elem._ir_var is None:
                     name = elem.name
                     if name not in self._dyn_var_cache:
-                        self._dyn_var_cache[name] = ir.Var(name, ir.ScalarType(DataType.INDEX), span)
+                        self._dyn_var_cache[name] = ir.Var(name, scalar_type(DataType.INDEX), span)
                     elem._ir_var = self._dyn_var_cache[name]
                 elif elem.name not in self._dyn_var_cache:
                     self._dyn_var_cache[elem.name] = elem._ir_var
@@ -829,7 +829,7 @@ class TypeResolver:
             if value._ir_var is None:
                 name = value.name
                 if name not in self._dyn_var_cache:
-                    self._dyn_var_cache[name] = ir.Var(name, ir.ScalarType(DataType.INDEX), span)
+                    self._dyn_var_cache[name] = ir.Var(name, scalar_type(DataType.INDEX), span)
                 value._ir_var = self._dyn_var_cache[name]
             elif value.name not in self._dyn_var_cache:
                 self._dyn_var_cache[value.name] = value._ir_var
@@ -1460,7 +1460,7 @@ class TypeResolver:
                     if value._ir_var is None:
                         if value.name not in self._dyn_var_cache:
                             self._dyn_var_cache[value.name] = ir.Var(
-                                value.name, ir.ScalarType(DataType.INDEX), self._get_span(node)
+                                value.name, scalar_type(DataType.INDEX), self._get_span(node)
                             )
                         value._ir_var = self._dyn_var_cache[value.name]
                     elif value.name not in self._dyn_var_cache:
@@ -1477,7 +1477,7 @@ class TypeResolver:
             # When re-parsing printed IR, dynamic vars like M, N are defined as pl.dynamic() at module
             # scope but may not be captured in closure_vars from the decorator frame.
             if name not in self._dyn_var_cache:
-                self._dyn_var_cache[name] = ir.Var(name, ir.ScalarType(DataType.INDEX), self._get_span(node))
+                self._dyn_var_cache[name] = ir.Var(name, scalar_type(DataType.INDEX), self._get_span(node))
             return self._dyn_var_cache[name]
         if self._parse_expression is not None:
             # Pre-flight: pl.yield_() emits an ir.YieldStmt to the builder as a side
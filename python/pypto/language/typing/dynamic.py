@@ -12,9 +12,9 @@
 from typing import Any
 
 from pypto.pypto_core import DataType
-from pypto.pypto_core.ir import Expr, ScalarType, Span, Var
+from pypto.pypto_core.ir import Expr, Span, Var
 
-from .scalar import Scalar
+from .scalar import Scalar, scalar_type
 
 
 class DynVar(Scalar):
@@ -33,6 +33,8 @@ class DynVar(Scalar):
             ...
     """
 
+    __slots__ = ("name", "_ir_var")
+
     def __init__(self, name: str) -> None:
         if not name.isidentifier():
             raise ValueError(f"DynVar name must be a valid identifier, got {name!r}")
@@ -54,7 +56,7 @@ class DynVar(Scalar):
         Scalar-consuming paths without requiring prior TypeResolver resolution.
         """
         if self._ir_var is None:
-            self._ir_var = Var(self.name, ScalarType(DataType.INDEX), Span.unknown())
+            self._ir_var = Var(self.name, scalar_type(DataType.INDEX), Span.unknown())
         # Keep Scalar.expr in sync so direct .expr access returns a valid value.
         self.expr = self._ir_var
         return self._ir_var
@@ -9,10 +9,17 @@
 
 """Scalar wrapper type for PyPTO Language DSL."""
 
+import functools
 from typing import Any, cast
 
 from pypto.pypto_core import DataType
-from pypto.pypto_core.ir import Expr
+from pypto.pypto_core.ir import Expr, ScalarType
+
+
+@functools.cache
+def scalar_type(dtype: DataType) -> ScalarType:
+    """Return the shared ScalarType for dtype; IR types are immutable, so one per dtype suffices."""
+    return ScalarType(dtype)
 
 
 def _validate_scalar_meta_call(args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
@@ -101,6 +108,8 @@ class Scalar(metaclass=ScalarMeta):
         ...     return result
     """
 
+    __slots__ = ("dtype", "expr", "_annotation_only")
+
     def __init__(
         self,
         dtype: DataType | None = None,
@@ -168,6 +168,8 @@ class Tensor(metaclass=TensorMeta):
         ...     return result
     """
 
+    __slots__ = ("shape", "dtype", "layout", "memref", "_expr")
+
     def __init__(
         self,
         shape: Sequence[int] | None = None,
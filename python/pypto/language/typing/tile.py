@@ -144,6 +144,8 @@ class Tile(metaclass=TileMeta):
         ...     return pl.store(result, [0, 0], input)
     """
 
+    __slots__ = ("shape", "dtype", "memref", "memory_space", "tile_view", "_expr")
+
     def __init__(
         self,
         shape: Sequence[int] | None = None,
@@ -3057,7 +3057,8 @@ def register_op_conversion_custom(from_op: str, func: object) -> None:
 
     Args:
         from_op: Source op name
-        func: Callable(args, kwargs, span) -> Expr | tuple[list[Stmt], Expr]
+        func: Callable(args, kwargs, span) -> Expr | tuple[list[Stmt], Expr],
+            where kwargs is a dict[str, Any]
     """
 
 def has_op_conversion(op_name: str) -> bool:
@@ -204,8 +204,8 @@ def _load_orch_entry(output_dir: Path) -> tuple[Any, Any]:
 
     entry_candidates = [
         obj
-        for name in dir(orch_module)
-        if isinstance((obj := getattr(orch_module, name)), types.FunctionType)
+        for obj in vars(orch_module).values()
+        if isinstance(obj, types.FunctionType)
         and getattr(obj, "__module__", None) == orch_module.__name__
         and getattr(obj, _ENTRY_MARKER, False)
     ]
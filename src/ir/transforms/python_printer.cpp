@@ -24,7 +24,6 @@
 #include <set>
 #include <sstream>
 #include <string>
-#include <typeindex>
 #include <typeinfo>
 #include <unordered_map>
 #include <unordered_set>
@@ -109,65 +108,68 @@ std::string CastModeToString(int mode) {
 
 // Precedence mapping for each expression type
 Precedence GetPrecedence(const ExprPtr& expr) {
-  // Using a static map is more efficient and maintainable than a long chain of dynamic_casts.
-  static const std::unordered_map<std::type_index, Precedence> kPrecedenceMap = {
-      // Logical operators≥
-      {std::type_index(typeid(Or)), Precedence::kOr},
-      {std::type_index(typeid(Xor)), Precedence::kXor},
-      {std::type_index(typeid(And)), Precedence::kAnd},
-      {std::type_index(typeid(Not)), Precedence::kNot},
-
-      // Comparison operators
-      {std::type_index(typeid(Eq)), Precedence::kComparison},
-      {std::type_index(typeid(Ne)), Precedence::kComparison},
-      {std::type_index(typeid(Lt)), Precedence::kComparison},
-      {std::type_index(typeid(Le)), Precedence::kComparison},
-      {std::type_index(typeid(Gt)), Precedence::kComparison},
-      {std::type_index(typeid(Ge)), Precedence::kComparison},
-
-      // Bitwise operators
-      {std::type_index(typeid(BitOr)), Precedence::kBitOr},
-      {std::type_index(typeid(BitXor)), Precedence::kBitXor},
-      {std::type_index(typeid(BitAnd)), Precedence::kBitAnd},
-      {std::type_index(typeid(BitShiftLeft)), Precedence::kBitShift},
-      {std::type_index(typeid(BitShiftRight)), Precedence::kBitShift},
-
-      // Arithmetic operators
-      {std::type_index(typeid(Add)), Precedence::kAddSub},
-      {std::type_index(typeid(Sub)), Precedence::kAddSub},
-      {std::type_index(typeid(Mul)), Precedence::kMulDivMod},
-      {std::type_index(typeid(FloorDiv)), Precedence::kMulDivMod},
-      {std::type_index(typeid(FloatDiv)), Precedence::kMulDivMod},
-      {std::type_index(typeid(FloorMod)), Precedence::kMulDivMod},
-      {std::type_index(typeid(Pow)), Precedence::kPow},
-
-      // Unary operators
-      {std::type_index(typeid(Neg)), Precedence::kUnary},
-      {std::type_index(typeid(BitNot)), Precedence::kUnary},
-
-      // Function-like operators and atoms
-      {std::type_index(typeid(Abs)), Precedence::kCall},
-      {std::type_index(typeid(Cast)), Precedence::kCall},
-      {std::type_index(typeid(Min)), Precedence::kCall},
-      {std::type_index(typeid(Max)), Precedence::kCall},
-      {std::type_index(typeid(Call)), Precedence::kCall},
-      {std::type_index(typeid(Var)), Precedence::kAtom},
-      {std::type_index(typeid(IterArg)), Precedence::kAtom},
-      {std::type_index(typeid(ConstInt)), Precedence::kAtom},
-      {std::type_index(typeid(ConstFloat)), Precedence::kAtom},
-      {std::type_index(typeid(ConstBool)), Precedence::kAtom},
-      {std::type_index(typeid(TupleGetItemExpr)), Precedence::kAtom},
-  };
-
   INTERNAL_CHECK(expr) << "Expression is null";
-  const Expr& expr_ref = *expr;
-  const auto it = kPrecedenceMap.find(std::type_index(typeid(expr_ref)));
-  if (it != kPrecedenceMap.end()) {
-    return it->second;
+  // Switch on the node kind: compiles to a jump table, no typeid hashing per lookup.
+  switch (expr->GetKind()) {
+    // Logical operators
+    case ObjectKind::Or:
+      return Precedence::kOr;
+    case ObjectKind::Xor:
+      return Precedence::kXor;
+    case ObjectKind::And:
+      return Precedence::kAnd;
+    case ObjectKind::Not:
+      return Precedence::kNot;
+
+    // Comparison operators
+    case ObjectKind::Eq:
+    case ObjectKind::Ne:
+    case ObjectKind::Lt:
+    case ObjectKind::Le:
+    case ObjectKind::Gt:
+    case ObjectKind::Ge:
+      return Precedence::kComparison;
+
+    // Bitwise operators
+    case ObjectKind::BitOr:
+      return Precedence::kBitOr;
+    case ObjectKind::BitXor:
+      return Precedence::kBitXor;
+    case ObjectKind::BitAnd:
+      return Precedence::kBitAnd;
+    case ObjectKind::BitShiftLeft:
+    case ObjectKind::BitShiftRight:
+      return Precedence::kBitShift;
+
+    // Arithmetic operators
+    case ObjectKind::Add:
+    case ObjectKind::Sub:
+      return Precedence::kAddSub;
+    case ObjectKind::Mul:
+    case ObjectKind::FloorDiv:
+    case ObjectKind::FloatDiv:
+    case ObjectKind::FloorMod:
+      return Precedence::kMulDivMod;
+    case ObjectKind::Pow:
+      return Precedence::kPow;
+
+    // Unary operators
+    case ObjectKind::Neg:
+    case ObjectKind::BitNot:
+      return Precedence::kUnary;
+
+    // Function-like operators
+    case ObjectKind::Abs:
+    case ObjectKind::Cast:
+    case ObjectKind::Min:
+    case ObjectKind::Max:
+    case ObjectKind::Call:
+      return Precedence::kCall;
+
+    // Atoms (Var, IterArg, constants, TupleGetItemExpr) and any other expression types.
+    default:
+      return Precedence::kAtom;
   }
-
-  // Default for any other expression types.
-  return Precedence::kAtom;
 }
 
 bool IsRightAssociative(const ExprPtr& expr) {
@@ -275,7 +277,7 @@ class IRPythonPrinter : public IRVisitor {
 
  private:
   std::ostringstream stream_;
-  int indent_level_ = 0;
+  std::string indent_;  // Current indentation; grown/shrunk in place instead of rebuilt per line
   std::string prefix_;                    // Prefix for type names (e.g., "pl" or "ir")
   bool concise_;                          // When true, omit intermediate type annotations
   ProgramPtr current_program_ = nullptr;  // Track when printing within Program (for self.method() calls)
@@ -309,7 +311,7 @@ class IRPythonPrinter : public IRVisitor {
   bool typed_index_consts_ = false;
 
   // Helper methods
-  std::string GetIndent() const;
+  const std::string& GetIndent() const;
   void IncreaseIndent();
   void DecreaseIndent();
 
@@ -471,7 +473,7 @@ std::string FormatFloatLiteral(double value) {
 std::string IRPythonPrinter::Print(const IRNodePtr& node) {
   stream_.str("");
   stream_.clear();
-  indent_level_ = 0;
+  indent_.clear();
 
   // Try each type in order
   if (auto program = As<Program>(node)) {
@@ -622,15 +624,13 @@ std::string IRPythonPrinter::Print(const TypePtr& type) {
   return prefix_ + ".UnknownType";
 }
 
-std::string IRPythonPrinter::GetIndent() const {
-  return std::string(static_cast<size_t>(indent_level_ * 4), ' ');
-}
+const std::string& IRPythonPrinter::GetIndent() const { return indent_; }
 
-void IRPythonPrinter::IncreaseIndent() { indent_level_++; }
+void IRPythonPrinter::IncreaseIndent() { indent_.append(4, ' '); }
 
 void IRPythonPrinter::DecreaseIndent() {
-  if (indent_level_ > 0) {
-    indent_level_--;
+  if (!indent_.empty()) {
+    indent_.resize(indent_.size() - 4);
   }
 }
 
@@ -260,6 +260,28 @@ class TestUtilityFunction:
         assert result.is_valid()
         assert result.begin_line == line_before + 1
 
+    def test_disabled_span_capture_returns_unknown(self):
+        """With capture disabled, implicit spans fall back to Span.unknown()."""
+        x = ir.Var("x", ir.TensorType([64], DataType.FP32), ir.Span.unknown())
+        explicit = ir.Span("explicit.py", 7, 1)
+
+        previous = ir.set_span_capture(False)
+        try:
+            assert not _get_span_or_capture(frame_offset=0).is_valid()
+            # The fallback is one shared instance, not a fresh Span per call.
+            assert _get_span_or_capture(frame_offset=0) is _get_span_or_capture(frame_offset=0)
+            assert not tensor_ops.add(x, x).span.is_valid()
+            # Explicit spans are still honoured.
+            assert tensor_ops.add(x, x, span=explicit).span.filename == "explicit.py"
+            # Operator overloads and IRBuilder share the same switch.
+            s = ir.Var("s", ir.ScalarType(DataType.INT32), ir.Span.unknown())
+            assert not (s + s).span.is_valid()
+            assert not ir.IRBuilder().var("v", ir.ScalarType(DataType.INT32)).span.is_valid()
+        finally:
+            ir.set_span_capture(previous)
+
+        assert _get_span_or_capture(frame_offset=0).is_valid()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
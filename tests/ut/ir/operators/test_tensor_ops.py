@@ -112,6 +112,27 @@ def test_tensor_matmul_with_transpose():
     assert isinstance(result_type, ir.TensorType)
 
 
+def test_tensor_matmul_default_kwargs():
+    """Default-argument matmul/matmul_acc still record every kwarg explicitly."""
+    span = ir.Span.unknown()
+    dim16 = ir.ConstInt(16, DataType.INT32, span)
+    tensor_type = ir.TensorType([dim16, dim16], DataType.FP32)
+    acc = ir.Var("acc", tensor_type, span)
+    lhs = ir.Var("lhs", tensor_type, span)
+    rhs = ir.Var("rhs", tensor_type, span)
+
+    matmul_call = ir.op.tensor.matmul(lhs, rhs)
+    assert dict(matmul_call.kwargs) == {"a_trans": False, "b_trans": False, "c_matrix_nz": False}
+
+    acc_call = ir.op.tensor.matmul_acc(acc, lhs, rhs)
+    assert dict(acc_call.kwargs) == {"a_trans": False, "b_trans": False}
+
+    # Non-default calls must not leak into the shared default kwargs.
+    transposed = ir.op.tensor.matmul(lhs, rhs, b_trans=True)
+    assert dict(transposed.kwargs)["b_trans"] is True
+    assert dict(ir.op.tensor.matmul(lhs, rhs).kwargs)["b_trans"] is False
+
+
 def test_tensor_matmul_acc():
     """Test tensor.matmul_acc operation."""
     span = ir.Span.unknown()
@@ -1072,6 +1093,21 @@ def test_tensor_minimum():
     assert call_ts.op.name == "tensor.minimum"
 
 
+@pytest.mark.parametrize("op_name", ["add", "sub", "mul", "div"])
+@pytest.mark.parametrize("literal", [2, 1.5])
+def test_tensor_binary_literal_rhs_selects_scalar_op(op_name, literal):
+    """Python int/float rhs dispatches directly to the scalar op variant."""
+    span = ir.Span.unknown()
+    dim16 = ir.ConstInt(16, DataType.INT32, span)
+    var_a = ir.Var("a", ir.TensorType([dim16, dim16], DataType.FP32), span)
+
+    call = getattr(ir.op.tensor, op_name)(var_a, literal)
+
+    assert call.op.name == f"tensor.{op_name}s"
+    assert isinstance(call.args[1], (ir.ConstInt, ir.ConstFloat))
+    assert call.args[1].dtype == DataType.FP32
+
+
 def test_tensor_mul():
     """Test tensor.mul operation."""
     span = ir.Span.unknown()
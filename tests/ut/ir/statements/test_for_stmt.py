@@ -32,7 +32,7 @@ class TestForStmt:
 
         assert for_stmt is not None
         assert for_stmt.span.filename == "test.py"
-        assert cast(ir.Var, for_stmt.loop_var).name_hint == "i"
+        assert for_stmt.loop_var.name_hint == "i"
         assert isinstance(for_stmt.start, ir.ConstInt)
         assert isinstance(for_stmt.stop, ir.ConstInt)
         assert isinstance(for_stmt.step, ir.ConstInt)
@@ -57,25 +57,16 @@ class TestForStmt:
         assert for_stmt.step is not None
         assert isinstance(for_stmt.body, ir.SeqStmts)
         assert len(for_stmt.body.stmts) == 2
-        assert cast(ir.Var, for_stmt.loop_var).name_hint == "i"
+        assert for_stmt.loop_var.name_hint == "i"
         assert cast(ir.ConstInt, for_stmt.start).value == 0
         assert cast(ir.ConstInt, for_stmt.stop).value == 10
         assert cast(ir.ConstInt, for_stmt.step).value == 2
         assert len(for_stmt.return_vars) == 0
 
     def test_for_stmt_is_stmt(self):
-        """Test that ForStmt is an instance of Stmt."""
-        span = ir.Span.unknown()
-        dtype = DataType.INT64
-        i = ir.Var("i", ir.ScalarType(dtype), span)
-        start = ir.ConstInt(0, dtype, span)
-        stop = ir.ConstInt(10, dtype, span)
-        step = ir.ConstInt(1, dtype, span)
-        assign = ir.AssignStmt(i, start, span)
-        for_stmt = ir.ForStmt(i, start, stop, step, [], assign, [], span)
-
-        assert isinstance(for_stmt, ir.Stmt)
-        assert isinstance(for_stmt, ir.IRNode)
+        """Test that ForStmt is a subclass of Stmt."""
+        assert issubclass(ir.ForStmt, ir.Stmt)
+        assert issubclass(ir.ForStmt, ir.IRNode)
 
     def test_for_stmt_immutability(self):
         """Test that ForStmt attributes are immutable."""
@@ -118,7 +109,26 @@ class TestForStmt:
         assert isinstance(for_stmt.body, ir.SeqStmts)
         assert len(for_stmt.body.stmts) == 0
 
-    def test_for_stmt_with_different_expression_types(self):
+    @pytest.mark.parametrize(
+        ("bounds_factory", "expected_classes"),
+        [
+            (lambda x, y, z, s: (x, y, z), (ir.Var, ir.Var, ir.Var)),
+            (
+                lambda x, y, z, s: tuple(ir.ConstInt(v, DataType.INT64, s) for v in (0, 10, 1)),
+                (ir.ConstInt, ir.ConstInt, ir.ConstInt),
+            ),
+            (
+                lambda x, y, z, s: (
+                    ir.ConstInt(0, DataType.INT64, s),
+                    ir.Add(x, y, DataType.INT64, s),
+                    ir.ConstInt(1, DataType.INT64, s),
+                ),
+                (ir.ConstInt, ir.Add, ir.ConstInt),
+            ),
+        ],
+        ids=["var", "const_int", "mixed_binary_stop"],
+    )
+    def test_for_stmt_with_different_expression_types(self, bounds_factory, expected_classes):
         """Test ForStmt with different expression types for start, stop, step."""
         span = ir.Span("test.py", 1, 1, 1, 10)
         dtype = DataType.INT64
@@ -127,26 +137,13 @@ class TestForStmt:
         y = ir.Var("y", ir.ScalarType(dtype), span)
         z = ir.Var("z", ir.ScalarType(dtype), span)
         assign = ir.AssignStmt(i, x, span)
+        start, stop, step = bounds_factory(x, y, z, span)
 
-        # Test with Var expressions
-        for_stmt1 = ir.ForStmt(i, x, y, z, [], assign, [], span)
-        assert isinstance(for_stmt1.start, ir.Var)
-        assert isinstance(for_stmt1.stop, ir.Var)
-        assert isinstance(for_stmt1.step, ir.Var)
-
-        # Test with ConstInt expressions
-        start_const = ir.ConstInt(0, dtype, span)
-        stop_const = ir.ConstInt(10, dtype, span)
-        step_const = ir.ConstInt(1, dtype, span)
-        for_stmt2 = ir.ForStmt(i, start_const, stop_const, step_const, [], assign, [], span)
-        assert isinstance(for_stmt2.start, ir.ConstInt)
-        assert isinstance(for_stmt2.stop, ir.ConstInt)
-        assert isinstance(for_stmt2.step, ir.ConstInt)
-
-        # Test with binary expression
-        add_expr = ir.Add(x, y, dtype, span)
-        for_stmt3 = ir.ForStmt(i, start_const, add_expr, step_const, [], assign, [], span)
-        assert isinstance(for_stmt3.stop, ir.Add)
+        for_stmt = ir.ForStmt(i, start, stop, step, [], assign, [], span)
+        start_cls, stop_cls, step_cls = expected_classes
+        assert isinstance(for_stmt.start, start_cls)
+        assert isinstance(for_stmt.stop, stop_cls)
+        assert isinstance(for_stmt.step, step_cls)
 
     def test_for_stmt_with_multiple_statements(self):
         """Test ForStmt with multiple statements in body."""
@@ -79,16 +79,9 @@ class TestWhileStmt:
         assert isinstance(while_stmt.body, ir.YieldStmt)
 
     def test_while_stmt_is_stmt(self):
-        """Test that WhileStmt is an instance of Stmt."""
-        span = ir.Span.unknown()
-        dtype = DataType.INT64
-        x = ir.Var("x", ir.ScalarType(dtype), span)
-        condition = ir.Lt(x, ir.ConstInt(10, dtype, span), dtype, span)
-        assign = ir.AssignStmt(x, ir.ConstInt(0, dtype, span), span)
-        while_stmt = ir.WhileStmt(condition, [], assign, [], span)
-
-        assert isinstance(while_stmt, ir.Stmt)
-        assert isinstance(while_stmt, ir.IRNode)
+        """Test that WhileStmt is a subclass of Stmt."""
+        assert issubclass(ir.WhileStmt, ir.Stmt)
+        assert issubclass(ir.WhileStmt, ir.IRNode)
 
     def test_while_stmt_immutability(self):
         """Test that WhileStmt attributes are immutable."""
@@ -0,0 +1,161 @@
+# Copyright (c) PyPTO Contributors.
+# This program is free software, you can redistribute it and/or modify it under the terms and conditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# -----------------------------------------------------------------------------------------------------------
+
+"""Unit tests for the Python op-conversion helpers (ConversionContext / op_conversion)."""
+
+import pypto.language as pl
+import pytest
+from pypto import DataType, ir, passes
+from pypto.ir.op import tile as tile_ops
+from pypto.ir.op_conversion import ConversionContext, op_conversion, register_op_conversion
+
+
+def _scalar(value: int) -> ir.Expr:
+    return ir.ConstInt(value, DataType.INT32, ir.Span.unknown())
+
+
+class _TileCastFinder(ir.IRVisitor):
+    """Record the first ``tile.cast`` Call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.found: ir.Call | None = None
+
+    def visit_call(self, op: ir.Call) -> None:
+        if self.found is None and op.op.name == "tile.cast":
+            self.found = op
+        super().visit_call(op)
+
+
+def _convert_cast_program() -> ir.Call | None:
+    """Run ConvertTensorToTileOps over a single tensor.cast and return the resulting tile.cast."""
+
+    @pl.program
+    class Before:
+        @pl.function(type=pl.FunctionType.InCore)
+        def main_incore_0(self, x: pl.Tensor[[64], pl.FP32]) -> pl.Tensor[[64], pl.FP16]:
+            y: pl.Tensor[[64], pl.FP16] = pl.cast(x, target_type=pl.FP16)
+            return y
+
+        @pl.function
+        def main(self, x: pl.Tensor[[64], pl.FP32]) -> pl.Tensor[[64], pl.FP16]:
+            y: pl.Tensor[[64], pl.FP16] = self.main_incore_0(x)
+            return y
+
+    After = passes.convert_tensor_to_tile_ops()(Before)
+    finder = _TileCastFinder()
+    finder.visit_stmt(After.get_function("main_incore_0").body)
+    return finder.found
+
+
+@pytest.fixture(autouse=True)
+def _restore_cast_conversion():
+    """Tests override the tensor.cast conversion; restore the built-in name mapping afterwards."""
+    yield
+    register_op_conversion("tensor.cast", "tile.cast")
+
+
+class TestConversionContext:
+    """Test ConversionContext prologue building."""
+
+    def test_fresh_context_has_no_stmts(self):
+        """A context with no let()/emit() reports an empty prologue."""
+        ctx = ConversionContext(ir.Span.unknown())
+
+        assert ctx.stmts == []
+
+    def test_let_emits_assign_and_returns_var(self):
+        """let() records one AssignStmt binding the returned Var."""
+        ctx = ConversionContext(ir.Span.unknown())
+        var = ctx.let("tmp", _scalar(2))
+
+        assert len(ctx.stmts) == 1
+        assert isinstance(ctx.stmts[0], ir.AssignStmt)
+        assert ctx.stmts[0].var.same_as(var)
+        assert var.name_hint == "tmp"
+
+    def test_emit_appends_raw_stmt(self):
+        """emit() records statements in order after let()."""
+        span = ir.Span.unknown()
+        ctx = ConversionContext(span)
+        var = ctx.let("a", _scalar(3))
+        raw = ir.AssignStmt(ir.Var("b", var.type, span), var, span)
+        ctx.emit(raw)
+
+        assert len(ctx.stmts) == 2
+        assert ctx.stmts[1].same_as(raw)
+
+    def test_move_let_binds_moved_tile(self):
+        """move_let emits one AssignStmt whose value is a tile.move to the target space."""
+        span = ir.Span.unknown()
+        ctx = ConversionContext(span)
+        tile = ir.Var("t", ir.TileType([16, 16], DataType.FP16), span)
+
+        var = ctx.move_let("lhs", tile, ir.MemorySpace.Left)
+
+        assert len(ctx.stmts) == 1
+        value = ctx.stmts[0].value
+        assert isinstance(value, ir.Call)
+        assert value.op.name == "tile.move"
+        assert value.kwargs["target_memory"] == ir.MemorySpace.Left
+        assert ctx.stmts[0].var.same_as(var)
+
+
+class TestOpConversionDecorator:
+    """Test converters registered with @op_conversion, driven by ConvertTensorToTileOps."""
+
+    def test_converter_prologue_is_emitted(self):
+        """Statements bound through ctx.let land in the converted body ahead of the result."""
+
+        @op_conversion("tensor.cast")
+        def convert(ctx, args, kwargs, span):
+            src = ctx.let("cast_src", args[0])
+            return tile_ops.cast(src, kwargs["target_type"], kwargs["mode"], span=span)
+
+        cast = _convert_cast_program()
+
+        assert cast is not None
+        assert isinstance(cast.args[0], ir.Var)
+        assert cast.args[0].name_hint.startswith("cast_src")
+
+    def test_pure_converter_runs_without_context(self):
+        """A pure=True converter is called with ctx=None and its Expr is used unchanged."""
+        seen_ctx = []
+
+        @op_conversion("tensor.cast", pure=True)
+        def convert(ctx, args, kwargs, span):
+            seen_ctx.append(ctx)
+            return tile_ops.cast(args[0], kwargs["target_type"], kwargs["mode"], span=span)
+
+        cast = _convert_cast_program()
+
+        assert seen_ctx == [None]
+        assert cast is not None
+        assert cast.kwargs["target_type"] == DataType.FP16
+
+    def test_converter_receives_kwargs_dict(self):
+        """The C++ registry hands the Call's kwargs to Python converters as a dict keyed by name."""
+        seen_kwargs = []
+
+        @op_conversion("tensor.cast")
+        def convert(ctx, args, kwargs, span):
+            seen_kwargs.append(kwargs)
+            return tile_ops.cast(args[0], kwargs["target_type"], kwargs["mode"], span=span)
+
+        cast = _convert_cast_program()
+
+        assert len(seen_kwargs) == 1
+        assert isinstance(seen_kwargs[0], dict)
+        assert list(seen_kwargs[0]) == ["target_type", "mode"]
+        assert seen_kwargs[0]["target_type"] == DataType.FP16
+        assert cast is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
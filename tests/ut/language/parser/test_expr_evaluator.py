@@ -148,6 +148,58 @@ class TestErrorCases:
             ev.eval_expr(_parse_expr("__import__('os')"))
 
 
+class TestCodeCache:
+    """Tests for reuse of compiled code across evaluations."""
+
+    def test_repeat_eval_reuses_code(self):
+        ev = ExprEvaluator(closure_vars={"x": 3})
+        node = _parse_expr("x * 2")
+        assert ev.eval_expr(node) == 6
+        code = ev._code_cache[node]
+        assert ev.eval_expr(node) == 6
+        assert ev._code_cache[node] is code
+
+    def test_cached_code_sees_updated_closure_vars(self):
+        closure_vars = {"x": 3}
+        ev = ExprEvaluator(closure_vars=closure_vars)
+        node = _parse_expr("x + 1")
+        assert ev.eval_expr(node) == 4
+        closure_vars["x"] = 10
+        assert ev.eval_expr(node) == 11
+
+    def test_walrus_binds_locally_without_writing_closure_vars(self):
+        closure_vars = {"x": 3}
+        ev = ExprEvaluator(closure_vars=closure_vars)
+        assert ev.eval_expr(_parse_expr("(y := x)")) == 3
+        assert closure_vars == {"x": 3}
+
+
+class TestFastPaths:
+    """Tests for literal and bare-name evaluation that skips compile()."""
+
+    def test_constant_skips_compile(self):
+        ev = ExprEvaluator(closure_vars={})
+        node = _parse_expr("128")
+        assert ev.eval_expr(node) == 128
+        assert node not in ev._code_cache
+
+    def test_closure_name_skips_compile(self):
+        ev = ExprEvaluator(closure_vars={"x": 7})
+        node = _parse_expr("x")
+        assert ev.eval_expr(node) == 7
+        assert node not in ev._code_cache
+
+    def test_builtin_name_skips_compile(self):
+        ev = ExprEvaluator(closure_vars={})
+        node = _parse_expr("len")
+        assert ev.eval_expr(node) is len
+        assert node not in ev._code_cache
+
+    def test_closure_name_shadows_builtin(self):
+        ev = ExprEvaluator(closure_vars={"len": 5})
+        assert ev.eval_expr(_parse_expr("len")) == 5
+
+
 class TestTryEvalExpr:
     """Tests for try_eval_expr non-throwing variant."""
 
@@ -71,6 +71,17 @@ class TestTypeResolver:
         # Shape elements are ConstInt expressions
         assert result.dtype == DataType.FP16
 
+    def test_resolve_scalar_type_is_shared_per_dtype(self):
+        """Scalar annotations of the same dtype resolve to one shared ScalarType."""
+        resolver = _make_resolver()
+
+        first = resolver.resolve_type(ast.parse("pl.Scalar[pl.INT64]", mode="eval").body)
+        second = resolver.resolve_type(ast.parse("pl.Scalar[pl.INT64]", mode="eval").body)
+
+        assert isinstance(first, ir.ScalarType)
+        assert first.dtype == DataType.INT64
+        assert first is second
+
     def test_resolve_tensor_type_different_dtypes(self):
         """Test resolving tensor types with different data types."""
         resolver = _make_resolver()